@@ -8,7 +8,6 @@ Example
   and lots of dependencies: setuptools, numpy, etc.
 """
 import logging
-from pkg_resources import get_distribution, DistributionNotFound
 
 logging.basicConfig(
     level=logging.INFO,
@@ -18,6 +17,19 @@ logging.basicConfig(
 
 
 try:
-    __version__ = get_distribution(__name__).version
-except DistributionNotFound:
+    from importlib.metadata import version, PackageNotFoundError
+except ImportError:  # python < 3.8, importing pkg_resources is much slower
+    from pkg_resources import (
+        get_distribution,
+        DistributionNotFound as PackageNotFoundError,
+    )
+
+    def version(distribution_name):
+        """Get the version of the installed distribution."""
+        return get_distribution(distribution_name).version
+
+
+try:
+    __version__ = version(__name__)
+except PackageNotFoundError:
     __version__ = None
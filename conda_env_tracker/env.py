@@ -270,10 +270,12 @@ class Environment:
         """Raise an error if a package was not installed correctly. If this command removes a package that
         was previously specified by the user, then warn that it has been removed and remove it from the history.
         """
-        removed = []
-        for package in self.history.packages.get(source, {}):
-            if package not in self.dependencies.get(source, {}):
-                removed.append(package)
+        source_dependencies = self.dependencies.get(source, {})
+        removed = [
+            package
+            for package in self.history.packages.get(source, {})
+            if package not in source_dependencies
+        ]
         installed_names = set()
         if installed_packages:
             installed_names = {package.name for package in installed_packages}
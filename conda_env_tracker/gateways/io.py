@@ -1,5 +1,7 @@
 """Class to perform input output operations"""
 
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
 import logging
 import os
 from pathlib import Path
@@ -206,10 +208,16 @@ class EnvIO:
         """Copy the environment files.
         """
         path = Path(path)
-        for file_name in ["environment.yml", "history.yaml", "install.R"]:
-            file = self.env_dir / file_name
-            if file.exists():
-                shutil.copy(file, path / file_name)
+        file_names = ["environment.yml", "history.yaml", "install.R"]
+        files = [self.env_dir / file_name for file_name in file_names]
+        # The remote is often a network file system where each copy mostly waits on the server.
+        with ThreadPoolExecutor(max_workers=len(files)) as executor:
+            list(
+                executor.map(
+                    lambda file: shutil.copy(file, path / file.name),
+                    [file for file in files if file.exists()],
+                )
+            )
 
     def get_environment(self) -> Optional[dict]:
         """Get the environment file as a dict."""
@@ -228,11 +236,14 @@ class EnvIO:
         return None
 
     def write_history_file(self, history: History) -> None:
-        """write/update history yaml file"""
+        """write/update history yaml file, skipping the write when the file is already up-to-date"""
         self._setup_env_dir()
         history_file = self.env_dir / "history.yaml"
-        contents = yaml.dump(history.export(), default_flow_style=False)
-        formatted = self._format_yaml(contents)
+        stream = StringIO()
+        history.export_stream(stream)
+        formatted = self._format_yaml(stream.getvalue())
+        if history_file.is_file() and history_file.read_text() == formatted:
+            return
         history_file.write_text(formatted)
 
     def set_remote_dir(self, remote_dir: PathLike, yes: bool = False) -> None:
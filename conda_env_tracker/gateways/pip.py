@@ -6,7 +6,7 @@ which may be useful in corporate firewalls.
 
 import logging
 import subprocess
-from typing import Optional, Union
+from typing import Optional, Tuple, Union
 
 from conda_env_tracker.gateways.conda import (
     get_conda_activate_command,
@@ -66,7 +66,24 @@ def get_pip_install_command(
     packages: Packages, index: Union[str, ListLike] = PIP_DEFAULT_INDEX_URL
 ) -> str:
     """Get the command to pip install the package."""
+    return _format_pip_install_command(packages, _get_index_command(index))
+
+
+def get_pip_install_commands(
+    log_packages: Packages,
+    action_packages: Packages,
+    index: Union[str, ListLike] = PIP_DEFAULT_INDEX_URL,
+) -> Tuple[str, str]:
+    """Get the log and action pip install commands, formatting the index urls once."""
     index_command = _get_index_command(index)
+    return (
+        _format_pip_install_command(log_packages, index_command),
+        _format_pip_install_command(action_packages, index_command),
+    )
+
+
+def _format_pip_install_command(packages: Packages, index_command: str) -> str:
+    """Join the package specs into a pip install command with the index urls."""
     return (
         f"pip install {' '.join(package.spec for package in packages)} {index_command}"
     )
@@ -22,9 +22,7 @@ class Diff(dict):
                 version=dependency.version,
                 build=dependency.build,
             )
-        diffs = cls()
-        diffs[source] = {"upsert": upsert}
-        return diffs
+        return cls({source: {"upsert": upsert}})
 
     @classmethod
     def compute(
@@ -47,23 +45,22 @@ class Diff(dict):
         for key, value in update.items():
             if key not in upsert:
                 upsert[key] = value
-        diff = cls()
-        diff[source] = {}
+        sections = {}
         if upsert:
-            diff[source]["upsert"] = upsert
+            sections["upsert"] = upsert
         if remove:
-            diff[source]["remove"] = remove
-        return diff
+            sections["remove"] = remove
+        return cls({source: sections})
 
     @staticmethod
     def _get_dependencies_diff(current_dependencies: dict, current_packages: dict):
         removed = {}
         updated = {}
         for package_name, package in current_packages.items():
-            if package_name not in current_dependencies:
+            dependency = current_dependencies.get(package_name)
+            if dependency is None:
                 removed[package_name] = package
-            elif package.version != current_dependencies[package_name].version:
-                dependency = current_dependencies[package_name]
+            elif package.version != dependency.version:
                 updated[package_name] = Package(
                     name=package.name,
                     spec=package.spec,
@@ -95,20 +92,18 @@ class Diff(dict):
     @classmethod
     def parse(cls, history_section: dict):
         """Parse the history.yaml file."""
-        diff = cls()
+        diff = {}
         for source, sections in history_section.items():
-            diff[source] = {}
+            source_diff = diff[source] = {}
             for section_name, package_specs in sections.items():
-                diff[source][section_name] = {}
+                section = source_diff[section_name] = {}
                 for spec in package_specs:
                     if section_name == "remove" or source == "r":
-                        package_name = spec
-                        diff[source][section_name][package_name] = Package.from_spec(
-                            package_name
-                        )
+                        package = Package.from_spec(spec)
                     else:
                         package_name, version = Package.separate_spec(spec)
-                        diff[source][section_name][package_name] = Package(
+                        package = Package(
                             name=package_name, spec=package_name, version=version
                         )
-        return diff
+                    section[package.name] = package
+        return cls(diff)
@@ -1,9 +1,11 @@
 """The classes to represent the history of the environment for reproducibility and transparency."""
 
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, TextIO
 from uuid import uuid4
 
+import yaml
+
 from conda_env_tracker.channels import Channels
 from conda_env_tracker.gateways.conda import get_dependencies
 from conda_env_tracker.packages import Package, Packages
@@ -17,6 +19,10 @@ from conda_env_tracker.history.packages import PackageRevision
 from conda_env_tracker.history.revisions import Revisions
 from conda_env_tracker.types import ListLike
 
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:  # libyaml bindings are not available
+    from yaml import SafeDumper
 
 logger = logging.getLogger(__name__)
 
@@ -124,12 +130,21 @@ class History:
             "revisions": self.revisions.export(),
         }
 
+    def export_stream(self, stream: TextIO) -> None:
+        """Dump the exported history as yaml into the stream using the libyaml dumper when available."""
+        yaml.dump(
+            self.export(),
+            stream,
+            Dumper=SafeDumper,
+            default_flow_style=False,
+            sort_keys=False,
+        )
+
     @staticmethod
     def history_diff(env_name: str, env, env_reader) -> ListLike:
         """return the difference between history and local environment"""
         version_diff_pkges: ListLike = []
         new_pkges: ListLike = []
-        missing_pkges: ListLike = []
 
         history_conda_pkges = env_reader.get_environment()["dependencies"]
         history_conda_pkges_dict = {}
@@ -138,17 +153,17 @@ class History:
             history_conda_pkges_dict[name] = package
         local_conda_pkges = get_dependencies(name=env_name)["conda"]
         for name, package in local_conda_pkges.items():
-            if name in history_conda_pkges_dict:
-                if package.version != history_conda_pkges_dict[name].version:
-                    version_diff_pkges.append(
-                        "-" + name + "=" + history_conda_pkges_dict[name]
-                    )
-                    version_diff_pkges.append("+" + name + "=" + package.version)
-            else:
+            history_package = history_conda_pkges_dict.get(name)
+            if history_package is None:
                 new_pkges.append("+" + name + "=" + package.version)
-        for package in env.history.packages["conda"]:
-            if package not in local_conda_pkges.keys():
-                missing_pkges.append("-" + package)
+            elif package.version != history_package.version:
+                version_diff_pkges.append("-" + name + "=" + history_package)
+                version_diff_pkges.append("+" + name + "=" + package.version)
+        missing_pkges: ListLike = [
+            "-" + name
+            for name in env.history.packages["conda"]
+            if name not in local_conda_pkges
+        ]
 
         return version_diff_pkges, new_pkges, missing_pkges
 
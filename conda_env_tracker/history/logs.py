@@ -7,6 +7,9 @@ from conda_env_tracker.gateways.r import R_COMMAND
 from conda_env_tracker.packages import Packages, Package
 from conda_env_tracker.types import ListLike
 
+CHANNEL_EXPRESSION = re.compile(r"(?<!\S)(?:--channel|-c)\s+(\S+)")
+INDEX_URL_EXPRESSION = re.compile(r"(?<!\S)(?:--index-url|--extra-index-url)\s+(\S+)")
+
 
 class Logs(list):
     """The log of the user creation and install commands for the environment."""
@@ -28,6 +31,10 @@ class Logs(list):
     def _extract_packages(self, index: int, packages: Packages) -> Packages:
         """Extracting conda and pip packages"""
         log = self[index]
+        if "=" not in log:
+            return Packages(
+                [Package(name=package.name, spec=package.name) for package in packages]
+            )
         extracted_packages = Packages()
         for package in packages:
             package_expression = re.compile(f"(({package.name})(=[a-z0-9_=.]+)?)")
@@ -106,18 +113,8 @@ class Logs(list):
 
     def extract_channels(self, index: int) -> ListLike:
         """Get the list of channels (if any) from a conda install command in the logs."""
-        cmd_pieces = self[index].split()
-        channels = []
-        for i, piece in enumerate(cmd_pieces):
-            if piece in ["--channel", "-c"]:
-                channels.append(cmd_pieces[i + 1])
-        return channels
+        return CHANNEL_EXPRESSION.findall(self[index])
 
     def extract_index_urls(self, index: int) -> ListLike:
         """Get the list of index urls from a pip install command in the logs."""
-        cmd_pieces = self[index].split()
-        index_urls = []
-        for i, piece in enumerate(cmd_pieces):
-            if piece in ["--index-url", "--extra-index-url"]:
-                index_urls.append(cmd_pieces[i + 1])
-        return index_urls
+        return INDEX_URL_EXPRESSION.findall(self[index])
@@ -23,10 +23,12 @@ class PackageRevision(dict):
         """Update the versions (and possible build strings) of the packages."""
         for source_name, source in self.items():
             source_dependencies = dependencies.get(source_name, {})
+            get_dependency = source_dependencies.get
             for package_name, package in source.items():
-                dependency = source_dependencies.get(
-                    package_name, Package(name=package_name)
-                )
+                dependency = get_dependency(package_name)
+                if dependency is None:
+                    package.version = None
+                    continue
                 package.version = dependency.version
                 if dependency.build:
                     package.build = dependency.build
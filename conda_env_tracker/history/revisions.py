@@ -12,6 +12,8 @@ from conda_env_tracker.history.packages import PackageRevision
 class Revisions:
     """The list of every revision to the environment (i.e. adding packages, removing packages or updating packages)."""
 
+    __slots__ = ("logs", "actions", "packages", "diffs", "debug")
+
     def __init__(
         self,
         logs: Logs,
@@ -56,18 +58,16 @@ class Revisions:
 
     def export(self):
         """Export to dump into a file and make sure not to mutate state."""
-        exported = []
-        for log, action, packages, diff, debug in zip(
-            self.logs, self.actions, self.packages, self.diffs, self.debug
-        ):
-            row = {}
-            row["packages"] = packages.export()
-            row["diff"] = diff.export()
-            row["log"] = log
-            row["action"] = action
-            row["debug"] = debug
-            exported.append(row)
-        return exported
+        return list(
+            map(
+                _export_revision,
+                self.logs,
+                self.actions,
+                self.packages,
+                self.diffs,
+                self.debug,
+            )
+        )
 
     @classmethod
     def parse(cls, history_section: list):
@@ -91,12 +91,28 @@ class Revisions:
         return f"Revisions(logs={self.logs}, actions={self.actions}, packages={self.packages}, debug={self.debug})"
 
     def __eq__(self, other):
+        """Compare the cheap flat lists first so the nested packages are only compared when needed."""
+        if self is other:
+            return True
         if (
             isinstance(other, Revisions)
             and self.logs == other.logs
             and self.actions == other.actions
-            and self.packages == other.packages
             and self.debug == other.debug
+            and self.packages == other.packages
         ):
             return True
         return False
+
+
+def _export_revision(
+    log: str, action: str, packages: PackageRevision, diff: Diff, debug: dict
+) -> dict:
+    """Export a single revision as a row of the history file."""
+    return {
+        "packages": packages.export(),
+        "diff": diff.export(),
+        "log": log,
+        "action": action,
+        "debug": debug,
+    }
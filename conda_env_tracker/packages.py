@@ -1,17 +1,23 @@
 """Keeping track of packages (as opposed to dependencies, which just come along for the ride)."""
 import re
+import sys
 
-from collections import defaultdict
 from typing import Dict, List, Tuple, Union
 
 from conda_env_tracker.types import ListLike
 
+SPEC_SEPARATOR_EXPRESSION = re.compile("[!<=>]+")
+
 
 class Package:
     """The metadata about each package."""
 
+    __slots__ = ("name", "spec", "version", "build", "date")
+
     def __init__(self, name, spec=None, version=None, build=None, date=None):
-        self.name = name
+        # The same names are repeated across every revision of the history, interning shares one string.
+        # YAML can load names such as `on` or all digits as bool or int, those are kept as loaded.
+        self.name = sys.intern(name) if isinstance(name, str) else name
         self.spec = spec
         self.version = version
         self.build = build
@@ -29,7 +35,7 @@ class Package:
     @staticmethod
     def separate_spec(spec: str) -> list:
         """Separate the package name from the version in the spec."""
-        return re.split("[!<=>]+", spec, maxsplit=1)
+        return SPEC_SEPARATOR_EXPRESSION.split(spec, maxsplit=1)
 
     def spec_is_name(self):
         """Check if the spec is just the package name."""
@@ -46,17 +52,25 @@ class Package:
         return not self.spec.startswith(self.name)
 
     def __eq__(self, other):
-        try:
-            if self.version and self.version != other.version:
-                return False
-            if self.build and self.build != other.build:
-                return False
-            return self.name == other.name and self.spec == other.spec
-        except AttributeError:
+        if other is self:
+            return True
+        if not isinstance(other, Package):
+            return NotImplemented
+        if self.name != other.name or self.spec != other.spec:
+            return False
+        if self.version and self.version != other.version:
+            return False
+        if self.build and self.build != other.build:
             return False
+        return True
 
     def __repr__(self):
-        return f"Package(name={self.name}, spec={self.spec}, version={self.version}, build={self.build})"
+        return "Package(name=%s, spec=%s, version=%s, build=%s)" % (
+            self.name,
+            self.spec,
+            self.version,
+            self.build,
+        )
 
 
 class Packages(list):
@@ -65,23 +79,26 @@ class Packages(list):
     def __init__(
         self, packages: Union[List[Package], Tuple[Package, ...], Package] = None
     ):
-        if packages:
+        if packages is None:
+            list.__init__(self)
+        else:
             if isinstance(packages, Package):
                 packages = [packages]
             list.__init__(self, packages)
-        else:
-            list.__init__(self)
+
+    @classmethod
+    def from_package(cls, package: Package):
+        """Make a list with a single Package instance without inspecting the argument."""
+        packages = cls.__new__(cls)
+        list.__init__(packages, (package,))
+        return packages
 
     @classmethod
     def from_specs(cls, specs: Union[ListLike, str]):
         """Make a list of Package instances from the package spec."""
-        packages = cls()
         if isinstance(specs, str):
-            packages.append(Package.from_spec(specs))
-        else:
-            for spec in specs:
-                packages.append(Package.from_spec(spec))
-        return packages
+            return cls([Package.from_spec(specs)])
+        return cls([Package.from_spec(spec) for spec in specs])
 
     def append_spec(self, spec: str):
         """Append an instance of the Package using the spec."""
@@ -90,11 +107,14 @@ class Packages(list):
 
 def get_packages(env: "Environment") -> Dict[str, List[Package]]:
     """This function gets the package information for all user requested packages in an environment."""
-    output_packages = defaultdict(list)
+    output_packages = {}
     for source, packages in env.history.packages.items():
+        if not packages:
+            continue
+        dependencies = env.dependencies[source]
+        source_packages = []
         for name, package in packages.items():
-            dep = env.dependencies[source][name]
-            output_packages[source].append(
-                Package(name, package.spec, dep.version, dep.build)
-            )
+            dep = dependencies[name]
+            source_packages.append(Package(name, package.spec, dep.version, dep.build))
+        output_packages[source] = source_packages
     return output_packages
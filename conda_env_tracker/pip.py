@@ -2,7 +2,7 @@
 from typing import Union
 
 from conda_env_tracker.gateways.pip import (
-    get_pip_install_command,
+    get_pip_install_commands,
     get_pip_custom_install_command,
     pip_install,
     pip_remove,
@@ -42,34 +42,38 @@ class PipHandler:
         index_url: Union[str, ListLike] = PIP_DEFAULT_INDEX_URL,
     ):
         """Update history for pip install."""
-        self.env.update_dependencies()
-        self.env.history.update_packages(
-            packages=packages, dependencies=self.env.dependencies, source="pip"
+        env = self.env
+        env.update_dependencies()
+        history = env.history
+        dependencies = env.dependencies
+        history.update_packages(
+            packages=packages, dependencies=dependencies, source="pip"
         )
-        self.env.validate_packages(packages, source="pip")
-
-        log = get_pip_install_command(packages=packages, index=index_url)
+        env.validate_packages(packages, source="pip")
 
-        specs = self.env.history.actions.get_package_specs(
-            packages=packages,
-            dependencies=self.env.dependencies["pip"],
-            version_separator="==",
+        specs = history.actions.get_package_specs(
+            packages=packages, dependencies=dependencies["pip"], version_separator="=="
         )
-        action = get_pip_install_command(
-            packages=Packages.from_specs(specs), index=index_url
+        log, action = get_pip_install_commands(
+            log_packages=packages,
+            action_packages=Packages.from_specs(specs),
+            index=index_url,
         )
 
-        self.env.history.append(log=log, action=action)
+        history.append(log=log, action=action)
 
     def update_history_custom_urls(self, package: Package):
         """Update history for pip install with custom urls"""
-        self.env.update_dependencies()
-        self.env.history.update_packages(
-            packages=Packages(package), dependencies=self.env.dependencies, source="pip"
+        env = self.env
+        packages = Packages.from_package(package)
+        env.update_dependencies()
+        history = env.history
+        history.update_packages(
+            packages=packages, dependencies=env.dependencies, source="pip"
         )
-        self.env.validate_packages(Packages(package), source="pip")
+        env.validate_packages(packages, source="pip")
         log = get_pip_custom_install_command(spec=package.spec)
-        self.env.history.append(log=log, action=log)
+        history.append(log=log, action=log)
 
     def remove(self, packages: Packages, yes: bool = False):
         """Remove the pip package including custom pip package"""
@@ -80,9 +84,11 @@ class PipHandler:
 
     def update_history_remove(self, packages: Packages) -> None:
         """Update history for pip remove."""
-        self.env.history.remove_packages(
-            packages=packages, dependencies=self.env.dependencies, source="pip"
+        env = self.env
+        history = env.history
+        history.remove_packages(
+            packages=packages, dependencies=env.dependencies, source="pip"
         )
-        self.env.validate_packages(source="pip")
+        env.validate_packages(source="pip")
         remove_command = get_pip_remove_command(packages=packages, yes=False)
-        self.env.history.append(log=remove_command, action=remove_command)
+        history.append(log=remove_command, action=remove_command)
@@ -1,4 +1,5 @@
 """Pull environment from remote to local."""
+
 # pylint: disable=too-many-return-statements
 import logging
 from typing import Optional
@@ -22,6 +23,10 @@ from conda_env_tracker.utils import prompt_yes_no, is_ordered_subset
 
 logger = logging.getLogger(__name__)
 
+R_TOOL = R_COMMAND.partition(" ")[0]
+# The history source name for the first word of each log command.
+LOG_SOURCES = {"conda": "conda", "pip": "pip", R_TOOL: "r"}
+
 
 def pull(env: Environment, yes: bool = False) -> Environment:
     """Pull history from remote to local"""
@@ -34,7 +39,9 @@ def pull(env: Environment, yes: bool = False) -> Environment:
 
     local_history = env.history
 
-    if _create_env_with_new_id(env=env, remote_history=remote_history, yes=yes):
+    if _create_env_with_new_id(
+        env=env, remote_dir=remote_dir, remote_history=remote_history, yes=yes
+    ):
         return replace_local_with_remote(
             env=env,
             remote_dir=remote_dir,
@@ -65,15 +72,18 @@ def pull(env: Environment, yes: bool = False) -> Environment:
             "Conflicting Packages in remote and local; user elected not to update"
         )
 
-    return merge_conflicting_changes(env=env)
+    return merge_conflicting_changes(
+        env=env,
+        remote_dir=remote_dir,
+        remote_io=remote_io,
+        remote_history=remote_history,
+    )
 
 
-def merge_conflicting_changes(env: Environment):
+def merge_conflicting_changes(
+    env: Environment, remote_dir: PathLike, remote_io: EnvIO, remote_history: History
+):
     """Reconciles packages between local and remote"""
-    remote_dir = env.local_io.get_remote_dir()
-    remote_io = EnvIO(env_directory=remote_dir)
-    remote_history = remote_io.get_history()
-
     local_history = env.history
     update_conda_environment(env_dir=remote_dir)
     if _r_env_needs_updating(
@@ -83,12 +93,25 @@ def merge_conflicting_changes(env: Environment):
     EnvIO.overwrite_local(local_io=env.local_io, remote_io=remote_io)
     new_env = Environment(name=env.name, history=remote_history)
     new_env.validate()
-    extra_logs = []
-    for log in local_history.logs:
-        if log not in set(remote_history.logs):
-            extra_logs.append(log)
-    for log in extra_logs:
-        new_env = _update_from_extra_log(env=new_env, history=local_history, log=log)
+    remote_logs = set(remote_history.logs)
+    extra_logs = [
+        (index, log)
+        for index, log in enumerate(local_history.logs)
+        if log not in remote_logs
+    ]
+    handlers = {
+        "conda": CondaHandler(env=new_env),
+        "pip": PipHandler(env=new_env),
+        "r": RHandler(env=new_env),
+    }
+    for index, log in extra_logs:
+        new_env = _update_from_extra_log(
+            env=new_env,
+            history=local_history,
+            log=log,
+            index=index,
+            handlers=handlers,
+        )
 
     new_env.validate()
     new_env.export()
@@ -123,18 +146,21 @@ def _nothing_to_pull(local_history: History, remote_history: History) -> bool:
     return False
 
 
-def _create_env_with_new_id(env: Environment, remote_history: History, yes: bool):
-    if env.history and remote_history and env.history.id != remote_history.id:
+def _create_env_with_new_id(
+    env: Environment, remote_dir: PathLike, remote_history: History, yes: bool
+):
+    local_history = env.history
+    if local_history and remote_history and local_history.id != remote_history.id:
         if yes or prompt_yes_no(
             prompt_msg=(
-                f"The remote cet environment ({env.local_io.get_remote_dir()}) doesn't match the local environment ({env.name})\n"
+                f"The remote cet environment ({remote_dir}) doesn't match the local environment ({env.name})\n"
                 "Would you like to replace your local environment"
             ),
             default=False,
         ):
             return True
         raise CondaEnvTrackerCreationError(
-            f"The remote environment ({env.local_io.get_remote_dir()}) appears to be new environment and would replace the current local environment ({env.name})\n"
+            f"The remote environment ({remote_dir}) appears to be new environment and would replace the current local environment ({env.name})\n"
             "User elected not to update"
         )
     return False
@@ -166,37 +192,35 @@ def _local_needs_update(
 
 def _r_env_needs_updating(local_history: History, remote_history: History) -> bool:
     """If there is an R command in remote that is not in local, then we return True."""
-    if not local_history:
-        new_actions = remote_history.actions
-    else:
-        new_actions = set(remote_history.actions) - set(local_history.actions)
-    for action in new_actions:
-        if action.startswith(R_COMMAND):
-            return True
-    return False
+    local_actions = set(local_history.actions) if local_history else ()
+    return any(
+        action.startswith(R_COMMAND) and action not in local_actions
+        for action in remote_history.actions
+    )
 
 
-def _update_from_extra_log(env: Environment, history: History, log: str) -> Environment:
-    """Update the local history and environment from the extra log entry."""
-    index = history.logs.index(log)
-    if log.startswith("conda"):
-        env = _handle_conda_extra_log(env=env, history=history, index=index)
-    elif log.startswith("pip"):
-        env = _handle_pip_extra_log(env=env, history=history, index=index)
-    elif log.startswith(R_COMMAND):
-        _handle_r_extra_log(env=env, history=history, index=index)
+def _update_from_extra_log(
+    env: Environment, history: History, log: str, index: int, handlers: dict
+) -> Environment:
+    """Update the local history and environment from the extra log entry at the index of the history logs."""
+    source = LOG_SOURCES.get(log.partition(" ")[0])
+    if source:
+        env = EXTRA_LOG_HANDLERS[source](
+            env=env, history=history, index=index, handler=handlers[source]
+        )
 
-    env = _update_history_packages_spec_from_log(env, history, log)
+    env = _update_history_packages_spec_from_log(
+        env=env, history=history, log=log, index=index
+    )
     return env
 
 
 def _update_history_packages_spec_from_log(
-    env: Environment, history: History, log: str
+    env: Environment, history: History, log: str, index: int
 ):
     """Since we ran the action with specific versions the packages in the history will have the wrong spec.
     We extract the spec from the log in the history and then update the packages.
     """
-    index = history.logs.index(log)
     if (
         log.startswith("conda remove")
         or log.startswith("pip uninstall")
@@ -214,12 +238,11 @@ def _update_history_packages_spec_from_log(
 
 
 def _handle_conda_extra_log(
-    env: Environment, history: History, index: int
+    env: Environment, history: History, index: int, handler: CondaHandler
 ) -> Environment:
     """Handle conda install, conda update --all and conda remove logs."""
     log = history.logs[index]
     channels = history.logs.extract_channels(index=index)
-    handler = CondaHandler(env=env)
     if log.startswith("conda remove"):
         packages = history.logs.extra_removed_packages(index=index)
         handler.remove(packages=packages, channels=channels)
@@ -234,11 +257,10 @@ def _handle_conda_extra_log(
 
 
 def _handle_pip_extra_log(
-    env: Environment, history: History, index: int
+    env: Environment, history: History, index: int, handler: PipHandler
 ) -> Environment:
     """Handle conda install, conda update --all and conda remove logs."""
     log = history.logs[index]
-    handler = PipHandler(env=env)
     if log.startswith("pip uninstall"):
         packages = history.logs.extra_removed_packages(index=index)
         handler.remove(packages=packages)
@@ -250,21 +272,35 @@ def _handle_pip_extra_log(
     return env
 
 
-def _handle_r_extra_log(env: Environment, history: History, index: int) -> Environment:
+def _handle_r_extra_log(
+    env: Environment, history: History, index: int, handler: RHandler
+) -> Environment:
     log = history.logs[index]
     if "remove.packages(" in log:
         packages = history.logs.extra_removed_packages(index=index)
-        RHandler(env=env).remove(packages=packages)
+        handler.remove(packages=packages)
     else:
-        package_names = [
-            package_name
+        packages = _get_r_extra_log_packages(history=history, index=index)
+        handler.install(packages=packages)
+    return env
+
+
+EXTRA_LOG_HANDLERS = {
+    "conda": _handle_conda_extra_log,
+    "pip": _handle_pip_extra_log,
+    "r": _handle_r_extra_log,
+}
+
+
+def _get_r_extra_log_packages(history: History, index: int) -> Packages:
+    """The R packages installed by the log entry at the index of the history logs."""
+    revision_packages = history.revisions.packages[index]["r"]
+    return Packages(
+        [
+            revision_packages[package_name]
             for package_name in history.revisions.diffs[index]["r"]["upsert"]
         ]
-        packages = Packages()
-        for package_name in package_names:
-            packages.append(history.revisions.packages[index]["r"][package_name])
-        RHandler(env=env).install(packages=packages)
-    return env
+    )
 
 
 def _no_new_actions_in_remote(
@@ -285,4 +321,5 @@ def _actions_in_different_order(
     local_history: History, remote_history: History
 ) -> bool:
     """Handle case when action are in different order in remote and local"""
-    return set(remote_history.actions).issubset(local_history.actions)
+    local_actions = set(local_history.actions)
+    return all(action in local_actions for action in remote_history.actions)
@@ -11,16 +11,15 @@ def process_specs(specs: ListLike, check_custom: bool = False) -> Packages:
     All package names for both pip and conda can be used with lowercase only. Conda automatically converts to lowercase.
     This allows our internal dictionaries that use package names as keys to be consistent with `conda list`.
     """
-    cleaned = Packages()
-    for spec in specs:
-        if check_custom and "/" in spec:
-            raise CondaEnvTrackerPackageNameError(
-                f"Found illegal character in package name or spec: '{spec}'.\n"
-                "Maybe you want to use --custom which requires package name and custom url, e.g.\n"
-                f"'cet pip install package_name --custom package_url'"
-            )
-        cleaned.append_spec(spec.lower())
-    return cleaned
+    if check_custom:
+        for spec in specs:
+            if "/" in spec:
+                raise CondaEnvTrackerPackageNameError(
+                    f"Found illegal character in package name or spec: '{spec}'.\n"
+                    "Maybe you want to use --custom which requires package name and custom url, e.g.\n"
+                    f"'cet pip install package_name --custom package_url'"
+                )
+    return Packages.from_specs([spec.lower() for spec in specs])
 
 
 def process_r_specs(package_names: ListLike, commands: ListLike) -> Packages:
@@ -29,7 +28,9 @@ def process_r_specs(package_names: ListLike, commands: ListLike) -> Packages:
         raise RError(
             f"Must have same number of package names ({len(package_names)}) and install commands ({len(commands)})."
         )
-    packages = Packages()
-    for package_name, command in zip(package_names, commands):
-        packages.append(Package(package_name, spec=command))
-    return packages
+    return Packages(
+        [
+            Package(package_name, spec=command)
+            for package_name, command in zip(package_names, commands)
+        ]
+    )
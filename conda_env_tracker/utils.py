@@ -2,23 +2,38 @@
 
 from conda_env_tracker.types import ListLike
 
+ANSWERS = {"yes": True, "y": True, "no": False, "n": False}
+DEFAULT_YES_ANSWERS = {**ANSWERS, "": True}
+DEFAULT_NO_ANSWERS = {**ANSWERS, "": False}
+
 
 def prompt_yes_no(prompt_msg: str, default: bool = True) -> bool:
     """Ask user to overwrite the local with remote"""
     if default:
-        answer = input(prompt_msg + " ([y]/n)? ").lower()
+        message = prompt_msg + " ([y]/n)? "
+        answers = DEFAULT_YES_ANSWERS
     else:
-        answer = input(prompt_msg + " (y/[n])? ").lower()
-    while answer not in ["yes", "y", "no", "n", ""]:
-        answer = input(f'Found {answer}, expected "y" or "n".\n{prompt_msg}').lower()
-    if answer in ["no", "n"]:
-        return False
-    if answer in ["yes", "y"]:
-        return True
-    return default
+        message = prompt_msg + " (y/[n])? "
+        answers = DEFAULT_NO_ANSWERS
+    while True:
+        answer = input(message).strip().casefold()
+        response = answers.get(answer)
+        if response is not None:
+            return response
+        message = f'Found {answer}, expected "y" or "n".\n{prompt_msg}'
 
 
 def is_ordered_subset(set: ListLike, subset: ListLike) -> bool:
     """Return true if all element in subset are in set and in order"""
-    set_iterator = iter(set)
-    return all(element in set_iterator for element in subset)
+    if not isinstance(set, (list, tuple)):
+        set_iterator = iter(set)
+        return all(element in set_iterator for element in subset)
+    if isinstance(subset, (list, tuple)) and len(subset) > len(set):
+        return False
+    start = 0
+    try:
+        for element in subset:
+            start = set.index(element, start) + 1
+    except ValueError:
+        return False
+    return True
@@ -2,7 +2,6 @@
 
 import os
 import pathlib
-import shutil
 import sys
 
 import click
@@ -19,16 +18,25 @@ PACKAGE_DIR = "conda_env_tracker"
     default=False,
     help="Run all tests including end-to-end tests",
 )
+@click.option(
+    "-p",
+    "--parallel",
+    is_flag=True,
+    default=False,
+    help="Run test modules in parallel with pytest-xdist",
+)
 @click.option("-v", "verbose", flag_value="-v", default=False)
 @click.option("-vv", "verbose", flag_value="-vv", default=False)
 @click.argument("pytest_args", nargs=-1, type=click.UNPROCESSED)
-def run_tests(all, verbose, pytest_args):
+def run_tests(all, parallel, verbose, pytest_args):
     """Run automated tests. By default, only run unit tests."""
-    returncode = _run_tests(all=all, verbose=verbose, pytest_args=pytest_args)
+    returncode = _run_tests(
+        all=all, parallel=parallel, verbose=verbose, pytest_args=pytest_args
+    )
     sys.exit(returncode)
 
 
-def _run_tests(all, verbose, pytest_args):
+def _run_tests(all, parallel, verbose, pytest_args):
     _remove_pycache(PACKAGE_DIR)
     args = ["--pylint", "--cov-report", "term-missing", f"--cov={PACKAGE_DIR}"]
     if verbose:
@@ -37,8 +45,12 @@ def _run_tests(all, verbose, pytest_args):
         args.extend(pytest_args)
     if not [arg for arg in args if arg == "-x" or arg.startswith("--maxfail")]:
         args.append("--maxfail=10")
+    if parallel:
+        # Keep each module on one worker since its tests share a conda environment.
+        args.extend(["-n", "auto", "--dist", "loadfile"])
     if all:
-        args.append("-s")
+        if not parallel:
+            args.append("-s")
         if not verbose:
             args.append("-vv")
     else:
@@ -49,8 +61,18 @@ def _run_tests(all, verbose, pytest_args):
 
 def _remove_pycache(dir):
     """Remove pycache directories."""
-    pycache = os.path.join(dir, "__pycache__")
-    shutil.rmtree(pycache, ignore_errors=True)
+    for root, dirs, _ in os.walk(dir):
+        if "__pycache__" not in dirs:
+            continue
+        dirs.remove("__pycache__")
+        pycache = os.path.join(root, "__pycache__")
+        try:
+            with os.scandir(pycache) as entries:
+                for entry in entries:
+                    os.unlink(entry.path)
+            os.rmdir(pycache)
+        except OSError:
+            pass
 
 
 if __name__ == "__main__":
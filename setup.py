@@ -12,13 +12,14 @@ setup(
     url="github.com/allstate-data-science/conda-env-tracker",
     packages=find_packages(),
     include_package_data=True,
-    install_requires=["click", "colorama", "oyaml>=0.8", "pyyaml>=5.0", "invoke"],
+    install_requires=["click", "colorama", "oyaml>=0.8", "pyyaml>=5.1", "invoke"],
     tests_require=[
         "pytest",
         "pytest-mock",
         "pytest-cov",
         "pylint",
         "pytest-pylint",
+        "pytest-xdist",
         "hypothesis",
     ],
     python_requires=">=3.6",
@@ -9,15 +9,28 @@ from conda_env_tracker.gateways.conda import delete_conda_environment
 from conda_env_tracker.gateways.io import USER_ENVS_DIR
 from conda_env_tracker.main import create, setup_remote
 
+REVISION_START = "  - packages:"
+
+
+@pytest.fixture(scope="session")
+def history_revision():
+    """Get the text of a revision in the history.yaml content by its index."""
+
+    def get_revision(history_content: str, index: int) -> str:
+        revisions = history_content.split("\n" + REVISION_START)
+        return REVISION_START + revisions[index + 1]
+
+    return get_revision
+
 
 @pytest.fixture(scope="module")
 def end_to_end_setup(request):
-    """Setup and teardown for tests."""
-    name = "end_to_end_test"
+    """Setup and teardown for tests, with an environment and remote per test module."""
+    name = "end_to_end_test_" + request.module.__name__.rpartition(".")[2]
     channels = ["defaults"]
     env_dir = USER_ENVS_DIR / name
 
-    remote_path = Path(__file__).parent.absolute() / "remote_test_dir"
+    remote_path = Path(__file__).parent.absolute() / f"remote_test_dir_{name}"
     if remote_path.exists():
         shutil.rmtree(remote_path)
     remote_path.mkdir()
@@ -40,6 +53,12 @@ def end_to_end_setup(request):
         teardown()
         raise err
 
+    env_file_start = (
+        [f"name: {name}", "channels:"]
+        + [f"  - {channel}" for channel in channels + ["nodefaults"]]
+        + ["dependencies:"]
+    )
+
     channel_command = (
         "--override-channels --strict-channel-priority --channel "
         + " --channel ".join(channels)
@@ -49,6 +68,9 @@ def end_to_end_setup(request):
         "name": name,
         "env": env,
         "env_dir": env_dir,
+        "history_file": env_dir / "history.yaml",
+        "env_file": env_dir / "environment.yml",
+        "env_file_start": env_file_start,
         "channels": channels,
         "channel_command": channel_command,
         "remote_dir": remote_path,
@@ -62,7 +84,7 @@ def r_end_to_end_setup(request):
     channels = ["r", "defaults"]
     env_dir = USER_ENVS_DIR / name
 
-    remote_path = Path(__file__).parent.absolute() / "remote_test_dir"
+    remote_path = Path(__file__).parent.absolute() / f"remote_test_dir_{name}"
     if remote_path.exists():
         shutil.rmtree(remote_path)
     remote_path.mkdir()
@@ -85,10 +107,19 @@ def r_end_to_end_setup(request):
         teardown()
         raise err
 
+    env_file_start = (
+        [f"name: {name}", "channels:"]
+        + [f"  - {channel}" for channel in channels + ["nodefaults"]]
+        + ["dependencies:"]
+    )
+
     return {
         "name": name,
         "env": env,
         "env_dir": env_dir,
+        "history_file": env_dir / "history.yaml",
+        "env_file": env_dir / "environment.yml",
+        "env_file_start": env_file_start,
         "channels": channels,
         "remote_dir": remote_path,
     }
@@ -37,40 +37,65 @@ if not os.environ["SHELL"].endswith("bash"):
     pytest.skip("Can only test with bash", allow_module_level=True)
 
 SHELL_AUTO_FILE = Path(main.__file__).parent / "shell" / "cet-auto.sh"
+SHELL_AUTO_FILE_ESCAPED = str(SHELL_AUTO_FILE).replace(" ", r"\ ")
+ACTIVATE = Path(os.environ["CONDA_EXE"]).parent / "activate"
 CET_ENV_NAME = "cet_auto_end_to_end_test"
 BASE_ENV_NAME = "base"
 UNSEEN_ENV_NAME = "unseen-cet-env"
 
 
+@pytest.fixture(scope="module")
+def cet_env(request, tmp_path_factory):
+    """Creating the cet environment and pushing it once for every setup_env param."""
+    env_dir = USER_ENVS_DIR / CET_ENV_NAME
+    remote_path = tmp_path_factory.mktemp("cet_env") / ".cet"
+
+    def teardown():
+        conda.delete_conda_environment(name=CET_ENV_NAME)
+        if env_dir.is_dir():
+            shutil.rmtree(env_dir)
+
+    request.addfinalizer(teardown)
+
+    remote_path.mkdir()
+
+    try:
+        env = main.create(
+            name=CET_ENV_NAME, specs=["python"], channels=["defaults"], yes=True
+        )
+        main.setup_remote(name=CET_ENV_NAME, remote_dir=remote_path, yes=True)
+        main.push(name=env.name)
+    except errors.CondaEnvTrackerCondaError as err:
+        teardown()
+        raise err
+
+    remote_files = {file.name: file.read_text() for file in remote_path.iterdir()}
+
+    return {
+        "env_dir": env_dir,
+        "remote_files": remote_files,
+        "local_history": (env_dir / "history.yaml").read_text(),
+    }
+
+
 @pytest.fixture(scope="module", params=[True, False])
-def setup_env(request):
+def setup_env(request, cet_env, tmp_path_factory):
     """Creating cet remotes to test cet auto shell script."""
-    # pylint: disable=too-many-statements
-    env_dir = USER_ENVS_DIR / CET_ENV_NAME
+    env_dir = cet_env["env_dir"]
     unseen_local_dir = USER_ENVS_DIR / UNSEEN_ENV_NAME
 
-    empty_dir = Path.home() / ".cet" / "empty_dir"
-    cet_dir = Path.home() / ".cet" / "cet_dir"
-    identical_history_dir = Path.home() / ".cet" / "identical_history_dir"
-    unseen_cet_dir = Path.home() / ".cet" / "unseen_cet_dir"
+    base_dir = tmp_path_factory.mktemp("cet_auto")
+    empty_dir = base_dir / "empty_dir"
+    cet_dir = base_dir / "cet_dir"
+    identical_history_dir = base_dir / "identical_history_dir"
+    unseen_cet_dir = base_dir / "unseen_cet_dir"
 
     remote_path = cet_dir / ".cet"
     identical_remote_path = identical_history_dir / ".cet"
     unseen_remote = unseen_cet_dir / ".cet"
 
     def teardown():
-        conda.delete_conda_environment(name=CET_ENV_NAME)
         conda.delete_conda_environment(name=UNSEEN_ENV_NAME)
-        if env_dir.is_dir():
-            shutil.rmtree(env_dir)
-        if cet_dir.is_dir():
-            shutil.rmtree(cet_dir)
-        if unseen_cet_dir.is_dir():
-            shutil.rmtree(unseen_cet_dir)
-        if identical_history_dir.is_dir():
-            shutil.rmtree(identical_history_dir)
-        if empty_dir.is_dir():
-            shutil.rmtree(empty_dir)
         if unseen_local_dir.is_dir():
             shutil.rmtree(unseen_local_dir)
 
@@ -82,33 +107,28 @@ def setup_env(request):
     unseen_cet_dir.mkdir()
 
     if request.param:
-        subprocess.run(f"cd {empty_dir}; git init --quiet", shell=True)
-        subprocess.run(f"cd {cet_dir}; git init --quiet", shell=True)
-        subprocess.run(f"cd {identical_history_dir}; git init --quiet", shell=True)
-        subprocess.run(f"cd {unseen_cet_dir}; git init --quiet", shell=True)
+        for directory in [empty_dir, cet_dir, identical_history_dir, unseen_cet_dir]:
+            subprocess.run(["git", "init", "--quiet"], cwd=directory, check=True)
 
     remote_path.mkdir()
     identical_remote_path.mkdir()
     unseen_remote.mkdir()
 
-    try:
-        env = main.create(
-            name=CET_ENV_NAME, specs=["python"], channels=["defaults"], yes=True
-        )
-        main.setup_remote(name=CET_ENV_NAME, remote_dir=remote_path, yes=True)
-        main.push(name=env.name)
-    except errors.CondaEnvTrackerCondaError as err:
-        teardown()
-        raise err
+    # Tests append to the local history file, so undo the edits of the previous param.
+    local_history_file = env_dir / "history.yaml"
+    local_history_file.write_text(cet_env["local_history"])
+    for file_name, file_content in cet_env["remote_files"].items():
+        (remote_path / file_name).write_text(file_content)
 
     remote_history_file = remote_path / "history.yaml"
-    content = remote_history_file.read_text()
+    content = cet_env["remote_files"]["history.yaml"]
+    conda_env_content = cet_env["remote_files"]["environment.yml"]
 
     # We add newline characters to the remote history file so that the unix utility `wc -m` will find more
     # characters in the remote history.yaml file than in the local history.yaml file. This prompts the cet_auto
     # shell function to ask the user to pull the changes from remote into local.
-    additional_characters = "\n\n\n"
-    remote_history_file.write_text(content + additional_characters)
+    with remote_history_file.open("a") as history_file:
+        history_file.write("\n\n\n")
 
     identical_remote_history_file = identical_remote_path / "history.yaml"
     identical_remote_history_file.write_text(content)
@@ -116,8 +136,6 @@ def setup_env(request):
     unseen_history_file = unseen_remote / "history.yaml"
     unseen_history_file.write_text(content.replace(CET_ENV_NAME, UNSEEN_ENV_NAME))
 
-    local_conda_env = env_dir / "environment.yml"
-    conda_env_content = local_conda_env.read_text()
     unseen_conda_env = unseen_remote / "environment.yml"
     unseen_conda_env.write_text(
         conda_env_content.replace(CET_ENV_NAME, UNSEEN_ENV_NAME)
@@ -128,11 +146,21 @@ def setup_env(request):
         "empty_cet": empty_dir,
         "identical_cet": identical_history_dir,
         "unseen_cet": unseen_cet_dir,
+        "remote_path": remote_path,
         "remote_history_file": remote_history_file,
-        "local_history_file": env_dir / "history.yaml",
+        "local_history_file": local_history_file,
     }
 
 
+@pytest.fixture(autouse=True)
+def reset_remote(setup_env):
+    """Point the shared environment's remote.yaml at the current param's remote before each test."""
+    remote_file = USER_ENVS_DIR / CET_ENV_NAME / "remote.yaml"
+    if remote_file.is_file():
+        remote_file.unlink()
+    main.setup_remote(name=CET_ENV_NAME, remote_dir=setup_env["remote_path"])
+
+
 @pytest.mark.parametrize("input", ["\n\n", "\ny\ny\n", "yes\nyes\n", "\ny\n", "y\n\n"])
 def test_cd_cet_yes_pushpull_yes_activate(setup_env, input):
     cet = setup_env["cet"]
@@ -343,12 +371,9 @@ def _run_shell(
     environment=BASE_ENV_NAME,
     activate_auto="unset CET_ACTIVATE_AUTO",
 ):
-    shell_auto_file = str(SHELL_AUTO_FILE).replace(" ", r"\ ")
-    activate = Path(os.environ["CONDA_EXE"]).parent / "activate"
-    prefix = f"{activate_auto};source {shell_auto_file};trap cet_auto DEBUG;source {activate} {environment};"
+    prefix = f"{activate_auto};source {SHELL_AUTO_FILE_ESCAPED};trap cet_auto DEBUG;source {ACTIVATE} {environment};"
     process = subprocess.run(
-        prefix + command,
-        shell=True,
+        ["bash", "-c", prefix + command],
         input=input,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
@@ -1,10 +1,11 @@
 """Test the history and environment.yml file after create and install."""
+from functools import lru_cache
 import re
 import subprocess
 from datetime import date
 
 import pytest
-import oyaml as yaml
+import yaml
 
 from conda_env_tracker.main import conda_install, conda_remove
 from conda_env_tracker.gateways.conda import (
@@ -15,45 +16,45 @@ from conda_env_tracker.gateways.conda import (
 from conda_env_tracker.gateways.pip import get_pip_version
 from conda_env_tracker.gateways.utils import get_platform_name
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # libyaml bindings are not available
+    from yaml import SafeLoader
+
+# pip is not upgraded by these tests, so one pip subprocess per environment is enough.
+cached_pip_version = lru_cache(maxsize=None)(get_pip_version)
+
 
 @pytest.mark.run(order=-7)
 def test_history_after_create(end_to_end_setup):
     """Test the history.yaml in detail."""
     name = end_to_end_setup["name"]
     env = end_to_end_setup["env"]
-    env_dir = end_to_end_setup["env_dir"]
     channels = end_to_end_setup["channels"]
     channel_command = end_to_end_setup["channel_command"]
 
-    history_file = env_dir / "history.yaml"
-    actual_history_content = history_file.read_text()
-    print(actual_history_content)
+    actual_history_content = end_to_end_setup["history_file"].read_text()
 
-    actual = yaml.load(actual_history_content, Loader=yaml.FullLoader)
+    actual = yaml.load(actual_history_content, Loader=SafeLoader)
 
     action_expected_pattern = rf"(conda create --name {name})(\s)(python=3.6)(.*)(\s)(colorama=)(.*)({channel_command})"
 
     expected_packages = {"conda": {"colorama": "*", "python": "python=3.6"}}
     expected_log = f"conda create --name {name} python=3.6 colorama {channel_command}"
 
-    expected_debug = [
-        {
-            "platform": get_platform_name(),
-            "conda_version": CONDA_VERSION,
-            "pip_version": get_pip_version(name=name),
-            "timestamp": str(date.today()),
-        }
-    ]
+    expected_debug = {
+        "platform": get_platform_name(),
+        "conda_version": CONDA_VERSION,
+        "pip_version": cached_pip_version(name=name),
+    }
 
     assert actual["packages"] == expected_packages
     assert actual["revisions"][-1]["log"] == expected_log
     assert actual["channels"] == channels
     assert re.match(action_expected_pattern, actual["revisions"][0]["action"])
-    for key, val in expected_debug[0].items():
-        if key == "timestamp":
-            assert actual["revisions"][0]["debug"][key].startswith(val)
-        else:
-            assert actual["revisions"][0]["debug"][key] == val
+    actual_debug = dict(actual["revisions"][0]["debug"])
+    assert actual_debug.pop("timestamp").startswith(str(date.today()))
+    assert actual_debug == expected_debug
 
     conda_dependencies = env.dependencies["conda"]
 
@@ -65,9 +66,10 @@ def test_history_after_create(end_to_end_setup):
     ]
     for channel in channels:
         expected_start.append(f"  - {channel}")
+    # Where yaml wraps the log and action depends on the environment name, they are checked on the parsed history.
     expected_history_start = "\n".join(
-        expected_start
-        + [
+        (
+            *expected_start,
             "packages:",
             "  conda:",
             "    python: python=3.6",
@@ -82,32 +84,19 @@ def test_history_after_create(end_to_end_setup):
             "        upsert:",
             f"        - python={conda_dependencies['python'].version}",
             f"        - colorama={conda_dependencies['colorama'].version}",
-            f"    log: conda create --name {name} python=3.6 colorama --override-channels",
-            "      --strict-channel-priority --channel main",
-            f"    action: conda create --name {name} python=3.6",
-        ]
-    )
-    first_action_start = f"action: conda create --name {name} python=3.6"
-    index_first_action = actual_history_content.find(first_action_start) + len(
-        first_action_start
+        )
     )
-    actual_history_start = actual_history_content[:index_first_action]
+    actual_history_start = actual_history_content[: len(expected_history_start)]
     assert actual_history_start == expected_history_start
 
 
 @pytest.mark.run(order=-6)
 def test_conda_env_yaml_after_create(end_to_end_setup):
     """Test the environment.yml file in detail."""
-    name = end_to_end_setup["name"]
-    env_dir = end_to_end_setup["env_dir"]
-    channels = end_to_end_setup["channels"]
-
-    conda_packages = get_dependencies(name=name)["conda"]
+    # The environment has not changed since create listed its dependencies.
+    conda_packages = end_to_end_setup["env"].dependencies["conda"]
 
-    expected_start = [f"name: {name}", "channels:"]
-    for channel in channels + ["nodefaults"]:
-        expected_start.append(f"  - {channel}")
-    expected_start.append("dependencies:")
+    expected_start = end_to_end_setup["env_file_start"]
 
     expected_packages = [
         "  - python=" + conda_packages["python"].version,
@@ -116,27 +105,23 @@ def test_conda_env_yaml_after_create(end_to_end_setup):
 
     expected = "\n".join(expected_start + expected_packages) + "\n"
 
-    actual = (env_dir / "environment.yml").read_text()
-    print(actual)
+    actual = end_to_end_setup["env_file"].read_text()
     assert actual == expected
 
 
 @pytest.mark.run(order=-5)
-def test_history_after_install(end_to_end_setup):
+def test_history_after_install(end_to_end_setup, history_revision):
     """Test the history.yaml file in detail after pytest has been installed."""
     name = end_to_end_setup["name"]
 
     env = conda_install(name=name, specs=["pytest>4.0,<6.0"], yes=True)
 
-    env_dir = end_to_end_setup["env_dir"]
     channels = end_to_end_setup["channels"]
     channel_command = end_to_end_setup["channel_command"]
 
-    log_file = env_dir / "history.yaml"
-    actual_history_content = log_file.read_text()
-    print(actual_history_content)
+    actual_history_content = end_to_end_setup["history_file"].read_text()
 
-    actual = yaml.load(actual_history_content, Loader=yaml.FullLoader)
+    actual = yaml.load(actual_history_content, Loader=SafeLoader)
 
     action_install_expected_pattern = (
         rf"(conda install --name {name})(\s)(pytest=)(.*)({channel_command})"
@@ -146,25 +131,20 @@ def test_history_after_install(end_to_end_setup):
         "conda": {"colorama": "*", "python": "python=3.6", "pytest": "pytest>4.0,<6.0"}
     }
     expected_log = f'conda install --name {name} "pytest>4.0,<6.0"'
-    expected_debug = 2 * [
-        {
-            "platform": get_platform_name(),
-            "conda_version": CONDA_VERSION,
-            "pip_version": get_pip_version(name=name),
-            "timestamp": str(date.today()),
-        }
-    ]
+    expected_debug = {
+        "platform": get_platform_name(),
+        "conda_version": CONDA_VERSION,
+        "pip_version": cached_pip_version(name=name),
+    }
 
     assert actual["packages"] == expected_packages
     assert len(actual["revisions"]) == 2
     assert actual["revisions"][-1]["log"] == expected_log
     assert actual["channels"] == channels
     assert re.match(action_install_expected_pattern, actual["revisions"][-1]["action"])
-    for key, val in expected_debug[1].items():
-        if key == "timestamp":
-            assert actual["revisions"][1]["debug"][key].startswith(val)
-        else:
-            assert actual["revisions"][1]["debug"][key] == val
+    actual_debug = dict(actual["revisions"][1]["debug"])
+    assert actual_debug.pop("timestamp").startswith(str(date.today()))
+    assert actual_debug == expected_debug
 
     # The packages section at the top of the file is current
     expected_packages_section = "\n".join(
@@ -197,16 +177,8 @@ def test_history_after_install(end_to_end_setup):
         ]
     )
 
-    index_first_revision = actual_history_content.find("  - packages:")
-    index_second_revision_start = actual_history_content.find(
-        "  - packages:", index_first_revision + 1
-    )
-    second_action = f"action: conda install --name {name} pytest"
-    index_second_action = actual_history_content.find(
-        second_action, index_second_revision_start
-    ) + len(second_action)
-    actual_second_revision = actual_history_content[
-        index_second_revision_start:index_second_action
+    actual_second_revision = history_revision(actual_history_content, 1)[
+        : len(expected_second_revision)
     ]
     assert actual_second_revision == expected_second_revision
 
@@ -215,15 +187,10 @@ def test_history_after_install(end_to_end_setup):
 def test_conda_env_yaml_after_install(end_to_end_setup):
     """Test the environment.yml file in detail after pytest has been installed."""
     name = end_to_end_setup["name"]
-    env_dir = end_to_end_setup["env_dir"]
-    channels = end_to_end_setup["channels"]
 
     conda_packages = get_dependencies(name=name)["conda"]
 
-    expected_start = [f"name: {name}", "channels:"]
-    for channel in channels + ["nodefaults"]:
-        expected_start.append(f"  - {channel}")
-    expected_start.append("dependencies:")
+    expected_start = end_to_end_setup["env_file_start"]
 
     expected_packages = [
         "  - python=" + conda_packages["python"].version,
@@ -233,8 +200,7 @@ def test_conda_env_yaml_after_install(end_to_end_setup):
 
     expected = "\n".join(expected_start + expected_packages) + "\n"
 
-    actual = (env_dir / "environment.yml").read_text()
-    print(actual)
+    actual = end_to_end_setup["env_file"].read_text()
     assert actual == expected
 
 
@@ -244,14 +210,12 @@ def test_rebuild(end_to_end_setup):
     name = end_to_end_setup["name"]
     env = end_to_end_setup["env"]
 
-    env_dir = end_to_end_setup["env_dir"]
-    initial_history_content = (env_dir / "history.yaml").read_text()
-    initial_env_file = (env_dir / "environment.yml").read_text()
+    initial_history_content = end_to_end_setup["history_file"].read_text()
+    initial_env_file = end_to_end_setup["env_file"].read_text()
     initial_process = subprocess.run(
-        f"conda list --name {name} --revisions",
-        shell=True,
+        ["conda", "list", "--name", name, "--revisions"],
         stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
         encoding="UTF-8",
     )
     initial_revisions = initial_process.stdout.split("\n")
@@ -264,16 +228,15 @@ def test_rebuild(end_to_end_setup):
     environments = get_all_existing_environment()
     assert name in environments
 
-    final_history_content = (env_dir / "history.yaml").read_text()
-    final_env_file = (env_dir / "environment.yml").read_text()
+    final_history_content = end_to_end_setup["history_file"].read_text()
+    final_env_file = end_to_end_setup["env_file"].read_text()
     assert final_env_file == initial_env_file
     assert final_history_content == initial_history_content
 
     final_process = subprocess.run(
-        f"conda list --name {name} --revisions",
-        shell=True,
+        ["conda", "list", "--name", name, "--revisions"],
         stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
         encoding="UTF-8",
     )
     final_revisions = final_process.stdout.split("\n")
@@ -290,10 +253,9 @@ def test_rebuild(end_to_end_setup):
 
 
 @pytest.mark.run(order=-2)
-def test_remove_package(end_to_end_setup):
+def test_remove_package(end_to_end_setup, history_revision):
     """Test the removal of a package."""
     name = end_to_end_setup["name"]
-    env_dir = end_to_end_setup["env_dir"]
     channels = end_to_end_setup["channels"]
     channel_command = end_to_end_setup["channel_command"].replace(
         "--strict-channel-priority ", ""
@@ -301,22 +263,19 @@ def test_remove_package(end_to_end_setup):
 
     conda_remove(name=name, specs=["colorama"], yes=True)
 
-    actual_env_content = (env_dir / "environment.yml").read_text()
+    actual_env_content = end_to_end_setup["env_file"].read_text()
     assert "colorama" not in actual_env_content
 
-    log_file = env_dir / "history.yaml"
-    actual_history_content = log_file.read_text()
-    print(actual_history_content)
+    actual_history_content = end_to_end_setup["history_file"].read_text()
 
-    actual = yaml.load(actual_history_content, Loader=yaml.FullLoader)
+    actual = yaml.load(actual_history_content, Loader=SafeLoader)
 
     expected_packages = {"conda": {"python": "python=3.6", "pytest": "pytest>4.0,<6.0"}}
     expected_log = f"conda remove --name {name} colorama"
     expected_debug = {
         "platform": get_platform_name(),
         "conda_version": CONDA_VERSION,
-        "pip_version": get_pip_version(name=name),
-        "timestamp": str(date.today()),
+        "pip_version": cached_pip_version(name=name),
     }
 
     assert actual["packages"] == expected_packages
@@ -327,11 +286,9 @@ def test_remove_package(end_to_end_setup):
         actual["revisions"][-1]["action"]
         == f"conda remove --name {name} colorama {channel_command}"
     )
-    for key, val in expected_debug.items():
-        if key == "timestamp":
-            assert actual["revisions"][2]["debug"][key].startswith(val)
-        else:
-            assert actual["revisions"][2]["debug"][key] == val
+    actual_debug = dict(actual["revisions"][2]["debug"])
+    assert actual_debug.pop("timestamp").startswith(str(date.today()))
+    assert actual_debug == expected_debug
 
     # The packages section at the top of the file is current
     expected_packages_section = "\n".join(
@@ -359,19 +316,8 @@ def test_remove_package(end_to_end_setup):
             f"    action: conda remove --name {name} colorama",
         ]
     )
-    index_first_revision = actual_history_content.find("  - packages:")
-    index_second_revision = actual_history_content.find(
-        "  - packages:", index_first_revision + 1
-    )
-    index_third_revision = actual_history_content.find(
-        "  - packages:", index_second_revision + 1
-    )
-    third_action = f"    action: {expected_log}"
-    index_third_action = actual_history_content.find(
-        third_action, index_third_revision
-    ) + len(third_action)
-    actual_third_revision = actual_history_content[
-        index_third_revision:index_third_action
+    actual_third_revision = history_revision(actual_history_content, 2)[
+        : len(expected_third_revision)
     ]
     assert actual_third_revision == expected_third_revision
 
@@ -4,8 +4,8 @@ import os
 import re
 from datetime import date
 
-import oyaml as yaml
 import pytest
+import yaml
 
 
 from conda_env_tracker.errors import PipInstallError
@@ -15,6 +15,16 @@ from conda_env_tracker.gateways.utils import get_platform_name
 from conda_env_tracker.main import pip_install, pip_remove
 from conda_env_tracker.packages import Packages
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # libyaml bindings are not available
+    from yaml import SafeLoader
+
+PIP_ACTION_PATTERN = re.compile(
+    r"pip install pytest==4\.0\.0\spytest-cov==.*--index-url "
+    + re.escape(pip.PIP_DEFAULT_INDEX_URL)
+)
+
 
 @pytest.fixture(scope="module")
 def pip_setup(end_to_end_setup):
@@ -27,20 +37,15 @@ def pip_setup(end_to_end_setup):
 
 
 @pytest.mark.run(order=-11)
-def test_history_pip_install(pip_setup):
+def test_history_pip_install(pip_setup, history_revision):
     """Test the history.yaml in detail."""
     name = pip_setup["name"]
     env = pip_setup["env"]
-    env_dir = pip_setup["env_dir"]
     channels = pip_setup["channels"]
 
-    history_file = env_dir / "history.yaml"
-    actual_history_content = history_file.read_text()
-    print(actual_history_content)
-
-    actual = yaml.load(actual_history_content, Loader=yaml.FullLoader)
+    actual_history_content = pip_setup["history_file"].read_text()
 
-    pip_action_exp = rf"(pip install pytest==4.0.0)(\s)(pytest-cov==)(.*)(--index-url {pip.PIP_DEFAULT_INDEX_URL})"
+    actual = yaml.load(actual_history_content, Loader=SafeLoader)
 
     expected_packages = {
         "conda": {"colorama": "*", "python": "python=3.6"},
@@ -49,26 +54,21 @@ def test_history_pip_install(pip_setup):
     expected_log = (
         f"pip install pytest==4.0.0 pytest-cov --index-url {pip.PIP_DEFAULT_INDEX_URL}"
     )
-    expected_debug = 2 * [
-        {
-            "platform": get_platform_name(),
-            "conda_version": CONDA_VERSION,
-            "pip_version": pip.get_pip_version(name=name),
-            "timestamp": str(date.today()),
-        }
-    ]
+    expected_debug = {
+        "platform": get_platform_name(),
+        "conda_version": CONDA_VERSION,
+        "pip_version": pip.get_pip_version(name=name),
+    }
     assert actual["name"] == name
     assert actual["channels"] == channels
     assert actual["packages"] == expected_packages
     assert actual["revisions"][-1]["log"] == expected_log
     assert len(actual["revisions"]) == 2
-    assert re.match(pip_action_exp, actual["revisions"][-1]["action"])
-    for i in range(len(actual["revisions"])):
-        for key, val in expected_debug[i].items():
-            if key == "timestamp":
-                assert actual["revisions"][i]["debug"][key].startswith(val)
-            else:
-                assert actual["revisions"][i]["debug"][key] == val
+    assert PIP_ACTION_PATTERN.match(actual["revisions"][-1]["action"])
+    for revision in actual["revisions"]:
+        actual_debug = dict(revision["debug"])
+        assert actual_debug.pop("timestamp").startswith(str(date.today()))
+        assert actual_debug == expected_debug
 
     # The packages section at the top of the file is current
     expected_packages_section = "\n".join(
@@ -106,16 +106,8 @@ def test_history_pip_install(pip_setup):
         ]
     )
 
-    index_first_revision = actual_history_content.find("  - packages:")
-    index_second_revision_start = actual_history_content.find(
-        "  - packages:", index_first_revision + 1
-    )
-    second_action = "action: pip install pytest"
-    index_second_action = actual_history_content.find(
-        second_action, index_second_revision_start
-    ) + len(second_action)
-    actual_second_revision = actual_history_content[
-        index_second_revision_start:index_second_action
+    actual_second_revision = history_revision(actual_history_content, 1)[
+        : len(expected_second_revision)
     ]
     assert actual_second_revision == expected_second_revision
 
@@ -124,17 +116,12 @@ def test_history_pip_install(pip_setup):
 def test_conda_env_yaml_pip_install(pip_setup):
     """Test the environment.yml file in detail."""
     name = pip_setup["name"]
-    env_dir = pip_setup["env_dir"]
-    channels = pip_setup["channels"]
 
     packages = get_dependencies(name=name)
     conda_packages = packages["conda"]
     pip_packages = packages["pip"]
 
-    expected_start = [f"name: {name}", "channels:"]
-    for channel in channels + ["nodefaults"]:
-        expected_start.append(f"  - {channel}")
-    expected_start.append("dependencies:")
+    expected_start = pip_setup["env_file_start"]
 
     expected_conda_packages = [
         "  - python=" + conda_packages["python"].version,
@@ -156,30 +143,26 @@ def test_conda_env_yaml_pip_install(pip_setup):
         + "\n"
     )
 
-    actual = (env_dir / "environment.yml").read_text()
-    print(actual)
+    actual = pip_setup["env_file"].read_text()
     assert actual == expected
 
 
 @pytest.mark.run(order=-9)
-def test_pip_remove(pip_setup):
+def test_pip_remove(pip_setup, history_revision):
     name = pip_setup["name"]
-    env_dir = pip_setup["env_dir"]
-    channels = pip_setup["channels"]
 
     pip_remove(name=name, specs=["pytest-cov"], yes=True)
 
-    history_file = env_dir / "history.yaml"
-    actual_history_content = history_file.read_text()
-    print(actual_history_content)
+    actual_history_content = pip_setup["history_file"].read_text()
     expected_packages = {
         "conda": {"colorama": "*", "python": "python=3.6"},
         "pip": {"pytest": "pytest==4.0.0"},
     }
-    actual = yaml.load(actual_history_content, Loader=yaml.FullLoader)
+    actual = yaml.load(actual_history_content, Loader=SafeLoader)
 
     expected_log = "pip uninstall pytest-cov"
     assert actual["packages"] == expected_packages
+    assert len(actual["revisions"]) == 3
     assert actual["revisions"][-1]["log"] == expected_log
     assert actual["revisions"][-1]["action"] == expected_log
 
@@ -187,10 +170,7 @@ def test_pip_remove(pip_setup):
     conda_packages = packages["conda"]
     pip_packages = packages["pip"]
 
-    expected_start = [f"name: {name}", "channels:"]
-    for channel in channels + ["nodefaults"]:
-        expected_start.append(f"  - {channel}")
-    expected_start.append("dependencies:")
+    expected_start = pip_setup["env_file_start"]
 
     expected_conda_packages = [
         "  - python=" + conda_packages["python"].version,
@@ -209,8 +189,7 @@ def test_pip_remove(pip_setup):
         + "\n"
     )
 
-    actual = (env_dir / "environment.yml").read_text()
-    print(actual)
+    actual = pip_setup["env_file"].read_text()
     assert actual == expected
 
     expected_packages_section = "\n".join(
@@ -242,19 +221,8 @@ def test_pip_remove(pip_setup):
             f"    action: pip uninstall pytest-cov",
         ]
     )
-    index_first_revision = actual_history_content.find("  - packages:")
-    index_second_revision = actual_history_content.find(
-        "  - packages:", index_first_revision + 1
-    )
-    index_third_revision = actual_history_content.find(
-        "  - packages:", index_second_revision + 1
-    )
-    third_action = f"    action: {expected_log}"
-    index_third_action = actual_history_content.find(
-        third_action, index_third_revision
-    ) + len(third_action)
-    actual_third_revision = actual_history_content[
-        index_third_revision:index_third_action
+    actual_third_revision = history_revision(actual_history_content, 2)[
+        : len(expected_third_revision)
     ]
     assert actual_third_revision == expected_third_revision
 
@@ -2,14 +2,19 @@
 # pylint: disable=redefined-outer-name
 from datetime import date
 
-import oyaml as yaml
 import pytest
+import yaml
 
 from conda_env_tracker.gateways import pip
 from conda_env_tracker.gateways.conda import CONDA_VERSION, get_dependencies
 from conda_env_tracker.main import r_install, r_remove
 from conda_env_tracker.gateways.utils import get_platform_name
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # libyaml bindings are not available
+    from yaml import SafeLoader
+
 
 @pytest.fixture(scope="module")
 def r_setup(r_end_to_end_setup):
@@ -28,19 +33,16 @@ def r_setup(r_end_to_end_setup):
 
 
 @pytest.mark.run(order=-14)
-def test_history_r_install(r_setup):
+def test_history_r_install(r_setup, history_revision):
     """Test the history.yaml in detail."""
     # pylint: disable=line-too-long
     name = r_setup["name"]
     env = r_setup["env"]
-    env_dir = r_setup["env_dir"]
     channels = r_setup["channels"]
 
-    history_file = env_dir / "history.yaml"
-    actual_history_content = history_file.read_text()
-    print(actual_history_content)
+    actual_history_content = r_setup["history_file"].read_text()
 
-    actual = yaml.load(actual_history_content, Loader=yaml.FullLoader)
+    actual = yaml.load(actual_history_content, Loader=SafeLoader)
 
     expected_packages = {
         "conda": {"r-base": "*", "r-devtools": "*"},
@@ -62,26 +64,21 @@ def test_history_r_install(r_setup):
         r'library(\"devtools\"); install_mran(\"praise\",version=\"1.0.0\",date=\"2019-01-01\")"'
     )
 
-    expected_debug = 2 * [
-        {
-            "platform": get_platform_name(),
-            "conda_version": CONDA_VERSION,
-            "pip_version": pip.get_pip_version(name=name),
-            "timestamp": str(date.today()),
-        }
-    ]
+    expected_debug = {
+        "platform": get_platform_name(),
+        "conda_version": CONDA_VERSION,
+        "pip_version": pip.get_pip_version(name=name),
+    }
     assert actual["name"] == name
     assert actual["channels"] == channels
     assert actual["packages"] == expected_packages
     assert actual["revisions"][-1]["log"] == expected_log
     assert len(actual["revisions"]) == 2
     assert actual["revisions"][-1]["action"] == expected_action
-    for i in range(len(actual["revisions"])):
-        for key, val in expected_debug[i].items():
-            if key == "timestamp":
-                assert actual["revisions"][i]["debug"][key].startswith(val)
-            else:
-                assert actual["revisions"][i]["debug"][key] == val
+    for revision in actual["revisions"]:
+        actual_debug = dict(revision["debug"])
+        assert actual_debug.pop("timestamp").startswith(str(date.today()))
+        assert actual_debug == expected_debug
 
     dependencies = env.dependencies
 
@@ -145,15 +142,8 @@ def test_history_r_install(r_setup):
     actual_history_start = actual_history_content[:index_first_action]
     assert actual_history_start == expected_history_start
 
-    index_second_revision_start = actual_history_content.find(
-        "  - packages:", index_first_action
-    )
-    index_second_debug = actual_history_content.find(
-        "debug:", index_second_revision_start
-    )
-    actual_second_revision = actual_history_content[
-        index_second_revision_start:index_second_debug
-    ].rstrip()
+    second_revision = history_revision(actual_history_content, 1)
+    actual_second_revision = second_revision[: second_revision.find("debug:")].rstrip()
     assert actual_second_revision == expected_second_revision
 
 
@@ -162,15 +152,11 @@ def test_conda_env_yaml_r_install(r_setup):
     """Test the environment.yml file in detail."""
     name = r_setup["name"]
     env_dir = r_setup["env_dir"]
-    channels = r_setup["channels"]
 
     packages = get_dependencies(name=name)
     conda_packages = packages["conda"]
 
-    expected_start = [f"name: {name}", "channels:"]
-    for channel in channels + ["nodefaults"]:
-        expected_start.append(f"  - {channel}")
-    expected_start.append("dependencies:")
+    expected_start = r_setup["env_file_start"]
 
     expected_conda_packages = [
         "  - r-base=" + conda_packages["r-base"].version,
@@ -179,8 +165,7 @@ def test_conda_env_yaml_r_install(r_setup):
 
     expected = "\n".join(expected_start + expected_conda_packages) + "\n"
 
-    actual = (env_dir / "environment.yml").read_text()
-    print(actual)
+    actual = r_setup["env_file"].read_text()
     assert actual == expected
 
     install_r = "\n".join(
@@ -191,29 +176,25 @@ def test_conda_env_yaml_r_install(r_setup):
     )
 
     actual_install_r = (env_dir / "install.R").read_text()
-    print(actual_install_r)
     assert actual_install_r == install_r
 
 
 @pytest.mark.run(order=-12)
-def test_r_remove_package(r_setup):
+def test_r_remove_package(r_setup, history_revision):
     # pylint: disable=too-many-locals
     name = r_setup["name"]
     env_dir = r_setup["env_dir"]
-    channels = r_setup["channels"]
 
     r_remove(name=name, specs=["praise"], yes=True)
 
-    history_file = env_dir / "history.yaml"
-    actual_history_content = history_file.read_text()
-    print(actual_history_content)
+    actual_history_content = r_setup["history_file"].read_text()
     expected_packages = {
         "conda": {"r-base": "*", "r-devtools": "*"},
         "r": {
             "jsonlite": 'library("devtools"); install_version("jsonlite", version="1.2")'
         },
     }
-    actual = yaml.load(actual_history_content, Loader=yaml.FullLoader)
+    actual = yaml.load(actual_history_content, Loader=SafeLoader)
     remove_command = r"remove.packages(c(\"praise\"))"
     expected_log = f'R --quiet --vanilla -e "{remove_command}"'
 
@@ -224,10 +205,7 @@ def test_r_remove_package(r_setup):
     packages = get_dependencies(name=name)
     conda_packages = packages["conda"]
 
-    expected_start = [f"name: {name}", "channels:"]
-    for channel in channels + ["nodefaults"]:
-        expected_start.append(f"  - {channel}")
-    expected_start.append("dependencies:")
+    expected_start = r_setup["env_file_start"]
 
     expected_conda_packages = [
         "  - r-base=" + conda_packages["r-base"].version,
@@ -236,8 +214,7 @@ def test_r_remove_package(r_setup):
 
     expected = "\n".join(expected_start + expected_conda_packages) + "\n"
 
-    actual = (env_dir / "environment.yml").read_text()
-    print(actual)
+    actual = r_setup["env_file"].read_text()
     assert actual == expected
 
     install_r = "\n".join(
@@ -245,7 +222,6 @@ def test_r_remove_package(r_setup):
     )
 
     actual_install_r = (env_dir / "install.R").read_text()
-    print(actual_install_r)
     assert actual_install_r == install_r
 
     expected_packages_section = "\n".join(
@@ -277,18 +253,7 @@ def test_r_remove_package(r_setup):
             rf'    action: R --quiet --vanilla -e "remove.packages(c(\"praise\"))"',
         ]
     )
-    index_first_revision = actual_history_content.find("  - packages:")
-    index_second_revision = actual_history_content.find(
-        "  - packages:", index_first_revision + 1
-    )
-    index_third_revision = actual_history_content.find(
-        "  - packages:", index_second_revision + 1
-    )
-    third_action = f"    action: {expected_log}"
-    index_third_action = actual_history_content.find(
-        third_action, index_third_revision
-    ) + len(third_action)
-    actual_third_revision = actual_history_content[
-        index_third_revision:index_third_action
+    actual_third_revision = history_revision(actual_history_content, 2)[
+        : len(expected_third_revision)
     ]
     assert actual_third_revision == expected_third_revision
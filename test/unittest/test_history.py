@@ -1,6 +1,8 @@
 """Test history class functions"""
+from io import StringIO
 
 import pytest
+import yaml
 
 from conda_env_tracker.channels import Channels
 from conda_env_tracker.history import Actions, Diff, History, Logs, PackageRevision
@@ -111,6 +113,24 @@ def test_export_success(mocker):
     assert expected == actual
 
 
+def test_export_stream():
+    """The streamed yaml keeps the key order of the exported history."""
+    history = History.create(
+        name="environment-name",
+        channels=Channels(["conda-forge", "main"]),
+        packages=PackageRevision(conda=dict(pytest=Package.from_spec("pytest"))),
+        logs=Logs(["conda create --name test pytest"]),
+        actions=Actions(["conda create --name test pytest=4.0=py36_0"]),
+        diff=Diff(conda=dict(upsert=dict(pytest=Package("pytest", version="4.0")))),
+        debug=[{"platform": "osx", "conda_version": "4.5.10"}],
+    )
+    stream = StringIO()
+    history.export_stream(stream)
+    actual = stream.getvalue()
+    assert actual.startswith("name: environment-name\nid: ")
+    assert yaml.safe_load(actual) == history.export()
+
+
 def test_export_empty(mocker):
     """Test package export"""
     mocker.patch("conda_env_tracker.history.history.uuid4").return_value = "unique_uuid"
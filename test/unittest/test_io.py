@@ -108,6 +108,28 @@ def test_write_history_file(env_io):
     )
 
 
+def test_write_history_file_unchanged(env_io, mocker):
+    """Writing the same history twice should not rewrite the file."""
+    history = History.create(
+        name="test-env",
+        channels=Channels(["main"]),
+        packages=PackageRevision({"conda": {"python": Package.from_spec("python")}}),
+        logs=Logs(["conda create -n test-env python"]),
+        actions=Actions(["conda create -n test-env python=3.7.3=buildstring"]),
+        diff=Diff(
+            {"conda": {"upsert": {"python": Package("python", version="3.7.3")}}}
+        ),
+        debug=["blah"],
+    )
+    env_io.write_history_file(history)
+    write_text = mocker.patch("pathlib.Path.write_text")
+    env_io.write_history_file(history)
+    write_text.assert_not_called()
+    history.channels.append("conda-forge")
+    env_io.write_history_file(history)
+    write_text.assert_called_once()
+
+
 def test_set_remote_dir(env_io, mocker):
     """Test to create remote setup file and assert remote dir path"""
     env_io.set_remote_dir(remote_dir="/dir1/dir2/dir3/dir4")
@@ -151,3 +151,9 @@ def test_get_packages_r(mocker):
     }
     actual = get_packages(env)
     assert actual == expected
+
+
+def test_package_non_string_name():
+    """YAML loads some package names as bool or int, they are kept as loaded."""
+    assert Package(True, "*").name is True
+    assert Package(1234, "*").name == 1234
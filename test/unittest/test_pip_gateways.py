@@ -39,6 +39,18 @@ def test_pip_install_command(packages, index, expected):
     assert actual == expected
 
 
+def test_pip_install_commands():
+    """Get the log and action pip install commands together."""
+    log, action = pip.get_pip_install_commands(
+        log_packages=[Package.from_spec("pytest")],
+        action_packages=[Package.from_spec("pytest==4.0.0")],
+        index=["first-index", "second-index"],
+    )
+    index_command = "--index-url first-index --extra-index-url second-index"
+    assert log == f"pip install pytest {index_command}"
+    assert action == f"pip install pytest==4.0.0 {index_command}"
+
+
 @pytest.mark.parametrize(
     "name, packages, index, active_conda_env, expected",
     [
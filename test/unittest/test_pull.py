@@ -601,6 +601,29 @@ def test_pull_remote_local_different_create_commands(setup_tests, prompt_value):
             pull(env=env)
 
 
+def test_pull_new_id_with_same_actions_updates_environment(setup_tests, mocker):
+    """The environment is rebuilt even when the local history has the remote actions."""
+    update_conda_mock = mocker.patch("conda_env_tracker.pull.update_conda_environment")
+    setup_tests["id_mock"].return_value = "my_other_unique_id"
+    remote_history = setup_tests["remote_history"]
+    local_history = History.create(
+        name=ENV_NAME,
+        channels=CHANNELS,
+        packages=remote_history.packages,
+        logs=remote_history.logs,
+        actions=Actions(remote_history.actions),
+        diff=Diff(),
+        debug=Debug(),
+    )
+    env = Environment(name=ENV_NAME, history=local_history)
+
+    new_env = pull(env=env, yes=True)
+
+    assert new_env.history.id == "my_unique_id"
+    update_conda_mock.assert_called_once()
+    setup_tests["overwrite_mock"].assert_called_once()
+
+
 def test_empty_local_history(setup_tests):
     """Empty local history should pull successfully."""
     env = Environment(name="test", history=None)
@@ -733,6 +756,78 @@ def test_pull_different_actions_in_both_r(setup_r_tests):
     assert final_env.history.revisions.diffs == expected_history.revisions.diffs
 
 
+def test_pull_different_actions_in_both_keeps_r_install_revisions(
+    setup_r_tests, mocker
+):
+    remote_history = setup_r_tests["remote_history"]
+    get_r_dependencies = setup_r_tests["get_r_dependencies"]
+    r_dependencies = {
+        "praise": Package("praise", "praise", "1.0.0"),
+        "dplyr": Package("dplyr", "dplyr", "0.8.3"),
+        "jsonlite": Package("jsonlite", "jsonlite", "1.6"),
+    }
+    get_r_dependencies.return_value = r_dependencies
+    local_logs = [
+        rf'{R_COMMAND} -e "install.packages(\"{name}\")"'
+        for name in ["praise", "dplyr"]
+    ]
+    r_install = mocker.patch("conda_env_tracker.r.r_install", side_effect=local_logs)
+
+    local_history = copy.deepcopy(remote_history)
+    local_packages = []
+    for name, version, log in zip(["praise", "dplyr"], ["1.0.0", "0.8.3"], local_logs):
+        package = Package(name, f'install.packages("{name}")', version)
+        local_packages.append(package)
+        local_history.packages.update_packages(packages=Packages(package), source="r")
+        local_history.logs.append(log)
+        local_history.actions.append(log)
+        local_history.revisions.diffs.append(
+            Diff.create(
+                packages=Packages(package),
+                dependencies={"r": r_dependencies},
+                source="r",
+            )
+        )
+        package_revision = PackageRevision()
+        package_revision.update_packages(packages=Packages(package), source="r")
+        local_history.revisions.packages.append(package_revision)
+
+    env = Environment(name=local_history.name, history=local_history)
+
+    remote_package = Package("jsonlite", 'install.packages("jsonlite")', "1.6")
+    remote_log = rf'{R_COMMAND} -e "install.packages(\"jsonlite\")"'
+    remote_history.packages.update_packages(
+        packages=Packages(remote_package), source="r"
+    )
+    remote_history.logs.append(remote_log)
+    remote_history.actions.append(remote_log)
+    remote_history.revisions.diffs.append(
+        Diff.create(
+            packages=Packages(remote_package),
+            dependencies={"r": r_dependencies},
+            source="r",
+        )
+    )
+    remote_package_revision = PackageRevision()
+    remote_package_revision.update_packages(
+        packages=Packages(remote_package), source="r"
+    )
+    remote_history.revisions.packages.append(remote_package_revision)
+
+    final_env = pull(env=env)
+
+    assert r_install.call_args_list == [
+        mocker.call(name=ENV_NAME, packages=Packages(package))
+        for package in local_packages
+    ]
+    assert final_env.history.logs[-3:] == [remote_log] + local_logs
+    assert final_env.history.actions[-3:] == [remote_log] + local_logs
+    assert [
+        list(diff["r"]["upsert"]) for diff in final_env.history.revisions.diffs[-2:]
+    ] == [["praise"], ["dplyr"]]
+    assert set(final_env.history.packages["r"]) == {"praise", "dplyr", "jsonlite"}
+
+
 @pytest.mark.parametrize("remove_location", ["remote", "local"])
 def test_pull_different_actions_in_both_remove_package_r(
     setup_r_tests, remove_location
@@ -3,7 +3,7 @@ from pathlib import Path
 
 import pytest
 
-from conda_env_tracker.utils import prompt_yes_no
+from conda_env_tracker.utils import is_ordered_subset, prompt_yes_no
 from conda_env_tracker.gateways.utils import (
     infer_remote_dir,
     run_command,
@@ -67,6 +67,12 @@ def test_prompt_yes_no_default(mocker):
     patch.assert_called_with(" (y/[n])? ")
 
 
+@pytest.mark.parametrize("default", [True, False])
+def test_prompt_yes_no_empty_answer_uses_default(mocker, default):
+    mocker.patch("conda_env_tracker.utils.input", side_effect=["maybe", " "])
+    assert prompt_yes_no(prompt_msg="", default=default) is default
+
+
 def test_exit_with_user_no(mocker):
     run_mock = mocker.patch("conda_env_tracker.gateways.utils.run")
     attrs = {
@@ -113,3 +119,21 @@ def test_run_command_error_message(mocker, caplog):
         run_command("command", CustomException)
     assert caplog.records[0].message == "command"
     assert str(err.value) == "Error message"
+
+
+@pytest.mark.parametrize(
+    "superset, subset, expected",
+    [
+        (["a", "b", "c"], ["a", "c"], True),
+        (["a", "b", "c"], [], True),
+        (["a", "b", "c"], ["c", "a"], False),
+        (["a", "b", "c"], ["a", "d"], False),
+        (["a", "b", "a"], ["b", "a"], True),
+        (["a", "b"], ["a", "a"], False),
+        (["a", "b"], ["a", "b", "c"], False),
+        (("a", "b", "c"), ["b", "c"], True),
+        (iter(["a", "b", "c"]), ["b", "c"], True),
+    ],
+)
+def test_is_ordered_subset(superset, subset, expected):
+    assert is_ordered_subset(set=superset, subset=subset) == expected
@@ -46,3 +46,12 @@ def test_validate_if_missing(mocker, if_missing):
             yes=False,
             if_missing=if_missing,
         )
+
+
+def test_validate_if_missing_without_remote(mocker):
+    env_io = mocker.Mock()
+    env_io.is_remote_dir_set.return_value = False
+    validate_remote_if_missing(
+        env_io=env_io, remote_dir="/path/to/new/remote", yes=False, if_missing=True
+    )
+    env_io.get_remote_dir.assert_not_called()